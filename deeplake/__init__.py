@@ -4,7 +4,7 @@ later streamed to deep learning models.
 """
 
 import threading
-from queue import Queue
+from queue import Empty, Queue
 from botocore.config import Config
 import numpy as np
 import multiprocessing
@@ -94,16 +94,31 @@ config = {"s3": Config(max_pool_connections=50, connect_timeout=300, read_timeou
 deeplake_reporter.tags.append(f"version:{__version__}")
 
 event_queue: Queue = Queue()
+EVENT_BATCH_SIZE = 100
 
 
 def send_event():
+    from deeplake.client.utils import get_user_name
+
     while True:
+        events = [event_queue.get()]
+        # Drain whatever queued up while the previous request was in flight.
+        while len(events) < EVENT_BATCH_SIZE:
+            try:
+                events.append(event_queue.get_nowait())
+            except Empty:
+                break
+        # Resolved once per batch instead of reading the reporting config for every event.
         try:
-            event = event_queue.get()
-            client, event_dict = event
-            client.send_event(event_dict)
+            username = get_user_name()
         except Exception:
-            pass
+            username = "public"
+        for client, event_dict in events:
+            try:
+                event_dict["deeplake_meta"].setdefault("username", username)
+                client.send_event(event_dict)
+            except Exception:
+                pass
 
 
 threading.Thread(target=send_event, daemon=True).start()
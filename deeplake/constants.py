@@ -41,6 +41,9 @@ MIN_SECOND_CACHE_SIZE = 160 * MB
 DEFAULT_MEMORY_CACHE_SIZE = 256
 DEFAULT_LOCAL_CACHE_SIZE = 0
 
+# fraction of an LRUCache that entries used more than once can occupy, the rest is kept for new entries
+CACHE_PROTECTED_RATIO = 0.75
+
 # maximum allowable size before `large_ok` must be passed to dataset delete methods
 DELETE_SAFETY_SIZE = 1 * GB
 
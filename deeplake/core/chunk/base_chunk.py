@@ -1,4 +1,6 @@
 from abc import abstractmethod
+import copyreg
+import pickle
 import struct
 import numpy as np
 from typing import List, Optional, Tuple, Union
@@ -44,7 +46,7 @@ from deeplake.util.exceptions import (
     EmptyTensorError,
 )
 from deeplake.core.polygon import Polygons
-from functools import reduce, wraps
+from functools import lru_cache, reduce, wraps
 from operator import mul
 
 InputSample = Union[
@@ -63,6 +65,17 @@ InputSample = Union[
 SerializedOutput = Tuple[bytes, Tuple]
 
 
+@lru_cache(maxsize=None)
+def _compression_flags(compression: Optional[str]) -> Tuple[bool, bool, bool]:
+    """Returns whether ``compression`` is a byte, image and video compression, computed once per compression."""
+    compression_type = get_compression_type(compression)
+    return (
+        compression_type == BYTE_COMPRESSION,
+        compression_type == IMAGE_COMPRESSION,
+        compression_type == VIDEO_COMPRESSION,
+    )
+
+
 class BaseChunk(DeepLakeMemoryObject):
     def __init__(
         self,
@@ -95,10 +108,11 @@ class BaseChunk(DeepLakeMemoryObject):
         )
 
         self.compression = compression
-        compression_type = get_compression_type(compression)
-        self.is_byte_compression = compression_type == BYTE_COMPRESSION
-        self.is_image_compression = compression_type == IMAGE_COMPRESSION
-        self.is_video_compression = compression_type == VIDEO_COMPRESSION
+        (
+            self.is_byte_compression,
+            self.is_image_compression,
+            self.is_video_compression,
+        ) = _compression_flags(compression)
         self.is_convert_candidate = self.htype == "image" or self.is_image_compression
 
         self.shapes_encoder = ShapeEncoder(encoded_shapes)
@@ -117,6 +131,8 @@ class BaseChunk(DeepLakeMemoryObject):
         )
         self._item_size = None
         self._sample_size = None
+        # Cached result of `nbytes`, reset whenever the data or the headers change.
+        self._nbytes: Optional[int] = None
         self.write_initialization_done = False
         self.id: Optional[str] = None
         self.key: Optional[str] = None
@@ -160,6 +176,23 @@ class BaseChunk(DeepLakeMemoryObject):
     @data_bytes.setter
     def data_bytes(self, value: Union[bytearray, bytes, memoryview, PartialReader]):
         self._data_bytes = value
+        self._nbytes = None
+
+    def __reduce_ex__(self, protocol):
+        state = self.__getstate__().copy()
+        data = state["_data_bytes"]
+        if isinstance(data, memoryview):
+            # Memoryviews can't be pickled, protocol 5 can write the viewed buffer without copying it.
+            state["_data_bytes"] = (
+                pickle.PickleBuffer(data) if protocol >= 5 else data.tobytes()
+            )
+        return copyreg.__newobj__, (self.__class__,), state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        if isinstance(self._data_bytes, pickle.PickleBuffer):
+            # Out-of-band buffers are handed back as is when unpickling.
+            self._data_bytes = self._data_bytes.raw()
 
     @property
     def num_data_bytes(self) -> int:
@@ -192,12 +225,14 @@ class BaseChunk(DeepLakeMemoryObject):
     @property
     def nbytes(self):
         """Calculates the number of bytes `tobytes` will be without having to call `tobytes`. Used by `LRUCache` to determine if this chunk can be cached."""
-        return infer_chunk_num_bytes(
-            self.version,
-            self.shapes_encoder.array,
-            self.byte_positions_encoder.array,
-            len_data=self.num_data_bytes,
-        )
+        if self._nbytes is None:
+            self._nbytes = infer_chunk_num_bytes(
+                self.version,
+                self.shapes_encoder.array,
+                self.byte_positions_encoder.array,
+                len_data=self.num_data_bytes,
+            )
+        return self._nbytes
 
     @property
     def header_bytes(self):
@@ -228,7 +263,7 @@ class BaseChunk(DeepLakeMemoryObject):
             self.version,
             self.shapes_encoder.array,
             self.byte_positions_encoder.array,
-            [self.data_bytes],
+            self.data_bytes,
         )
 
     @classmethod
@@ -289,6 +324,7 @@ class BaseChunk(DeepLakeMemoryObject):
             ffw_chunk(self)
             self.write_initialization_done = True
         self._make_data_bytearray()
+        self._nbytes = None
         self.is_dirty = True
 
     def serialize_sample(
@@ -435,7 +471,18 @@ class BaseChunk(DeepLakeMemoryObject):
             )
 
     def copy(self, chunk_args=None):
-        return self.frombuffer(self.tobytes(), chunk_args)
+        """Returns a copy of this chunk, copying the headers and data directly instead of round-tripping through `tobytes`."""
+        if isinstance(self.data_bytes, PartialReader):
+            self._make_data_bytearray()
+        chunk = self.__class__(
+            *chunk_args,
+            self.shapes_encoder.array.copy(),
+            self.byte_positions_encoder.array.copy(),
+            data=memoryview(bytes(self.data_bytes)),
+        )
+        chunk.version = self.version
+        chunk.is_dirty = False
+        return chunk
 
     def register_sample_to_headers(
         self,
@@ -463,6 +510,7 @@ class BaseChunk(DeepLakeMemoryObject):
                 padding = self.byte_positions_encoder.num_samples - num_samples
                 self._fill_empty_shapes(sample_shape, padding)
             self.shapes_encoder.register_samples(sample_shape, num_samples)
+        self._nbytes = None
 
     def register_in_meta_and_headers(
         self,
@@ -503,6 +551,7 @@ class BaseChunk(DeepLakeMemoryObject):
             self.shapes_encoder[local_index] = shape
             if not self.tensor_meta.is_link:
                 self.tensor_meta.update_shape_interval(shape)
+        self._nbytes = None
 
     def check_shape_for_update(self, shape):
         """Checks if the shape being assigned at the new index is valid."""
@@ -520,20 +569,13 @@ class BaseChunk(DeepLakeMemoryObject):
         if not old_data or self.byte_positions_encoder.is_empty():  # tiled sample
             return new_sample_bytes
         old_start_byte, old_end_byte = self.byte_positions_encoder[local_index]
-        left_data = old_data[:old_start_byte]  # type: ignore
-        right_data = old_data[old_end_byte:]  # type: ignore
-
-        # preallocate
-        total_new_bytes = len(left_data) + len(new_sample_bytes) + len(right_data)
-        new_data = bytearray(total_new_bytes)
+        # slicing a memoryview doesn't copy, so each region below is copied exactly once
+        old_view = memoryview(old_data)
+        left_data = old_view[:old_start_byte]
+        right_data = old_view[old_end_byte:]
 
-        # copy old data and add new data
-        new_start_byte = old_start_byte
-        new_end_byte = old_start_byte + len(new_sample_bytes)
-        new_data[:new_start_byte] = left_data
-        new_data[new_start_byte:new_end_byte] = new_sample_bytes
-        new_data[new_end_byte:] = right_data
-        return new_data
+        # join sizes the result up front and fills it without zero initializing it first
+        return bytearray().join((left_data, new_sample_bytes, right_data))
 
     def normalize_shape(self, shape):
         if shape is not None and len(shape) == 0:
@@ -564,6 +606,7 @@ class BaseChunk(DeepLakeMemoryObject):
                 self.shapes_encoder.pop()
             if not self.byte_positions_encoder.is_empty():
                 self.byte_positions_encoder.pop()
+        self._nbytes = None
 
     def _get_partial_sample_tile(self, as_bytes=False):
         if (
@@ -589,6 +632,7 @@ class BaseChunk(DeepLakeMemoryObject):
             self.shapes_encoder.pop(index)
         if not self.byte_positions_encoder.is_empty():
             self.byte_positions_encoder.pop(index)
+        self._nbytes = None
 
     def _fill_empty_shapes(self, shape, num_samples):
         dims = len(shape)
@@ -1,6 +1,7 @@
 from deeplake.constants import MB, PARTIAL_NUM_SAMPLES
 from deeplake.core.chunk.uncompressed_chunk import UncompressedChunk
 import numpy as np
+import pickle
 import pytest
 
 import deeplake
@@ -87,6 +88,22 @@ def test_read_write_sequence_big(cat_path):
             data_in = data_in[num_samples:]
 
 
+def test_read_write_sequence_mixed_shapes():
+    tensor_meta = create_tensor_meta()
+    common_args["tensor_meta"] = tensor_meta
+    dtype = tensor_meta.dtype
+    shapes = [(3, 4), (3, 4), (5, 2), (0, 4), (0, 4), (3, 4)]
+    data_in = [np.random.rand(*shape).astype(dtype) for shape in shapes]
+    chunk = UncompressedChunk(**common_args)
+    assert chunk.extend_if_has_space(list(data_in)) == len(data_in)
+    for i, sample in enumerate(data_in):
+        np.testing.assert_array_equal(chunk.read_sample(i), sample)
+    assert len(chunk.shapes_encoder.array) == 4
+    assert tensor_meta.length == len(data_in)
+    assert tensor_meta.min_shape == [0, 2]
+    assert tensor_meta.max_shape == [5, 4]
+
+
 def test_read_write_numpy():
     tensor_meta = create_tensor_meta()
     common_args["tensor_meta"] = tensor_meta
@@ -101,6 +118,18 @@ def test_read_write_numpy():
         data_in = data_in[num_samples:]
 
 
+def test_read_write_numpy_non_contiguous():
+    tensor_meta = create_tensor_meta()
+    common_args["tensor_meta"] = tensor_meta
+    dtype = tensor_meta.dtype
+    data_in = np.random.rand(10, 20, 40).astype(dtype)[:, :, ::2]
+    chunk = UncompressedChunk(**common_args)
+    num_samples = int(chunk.extend_if_has_space(data_in))
+    assert num_samples == 10
+    data_out = np.array([chunk.read_sample(i) for i in range(num_samples)])
+    np.testing.assert_array_equal(data_out, data_in)
+
+
 def test_read_write_numpy_big():
     tensor_meta = create_tensor_meta()
     common_args["tensor_meta"] = tensor_meta
@@ -147,3 +176,54 @@ def test_update():
             np.testing.assert_array_equal(chunk.read_sample(i), data_5)
         else:
             np.testing.assert_array_equal(chunk.read_sample(i), data_in[i])
+
+
+def test_nbytes_tracks_mutations():
+    tensor_meta = create_tensor_meta()
+    common_args["tensor_meta"] = tensor_meta
+    dtype = tensor_meta.dtype
+    chunk = UncompressedChunk(**common_args)
+    assert chunk.nbytes == len(chunk.tobytes())
+
+    chunk.extend_if_has_space([np.random.rand(10, 10).astype(dtype) for _ in range(3)])
+    assert chunk.nbytes == len(chunk.tobytes())
+
+    chunk.update_sample(1, np.random.rand(20, 5).astype(dtype))
+    assert chunk.nbytes == len(chunk.tobytes())
+
+    chunk.pop(0)
+    assert chunk.nbytes == len(chunk.tobytes())
+
+    chunk.pop_multiple(1)
+    assert chunk.nbytes == len(chunk.tobytes())
+
+
+@pytest.mark.parametrize("protocol", [4, 5])
+def test_pickle_memoryview_chunk(protocol):
+    tensor_meta = create_tensor_meta()
+    common_args["tensor_meta"] = tensor_meta
+    dtype = tensor_meta.dtype
+    chunk = UncompressedChunk(**common_args)
+    data_in = [np.random.rand(10, 10).astype(dtype) for _ in range(3)]
+    chunk.extend_if_has_space(data_in)
+    chunk_args = [
+        common_args["min_chunk_size"],
+        common_args["max_chunk_size"],
+        common_args["tiling_threshold"],
+        tensor_meta,
+        common_args["compression"],
+    ]
+    chunk = UncompressedChunk.frombuffer(bytes(chunk.tobytes()), chunk_args, copy=False)
+    assert isinstance(chunk.data_bytes, memoryview)
+
+    buffers = []
+    if protocol >= 5:
+        pickled = pickle.dumps(chunk, protocol=protocol, buffer_callback=buffers.append)
+        assert len(buffers) > 0
+    else:
+        pickled = pickle.dumps(chunk, protocol=protocol)
+    unpickled = pickle.loads(pickled, buffers=buffers)
+
+    assert bytes(unpickled.tobytes()) == bytes(chunk.tobytes())
+    for i, sample in enumerate(data_in):
+        np.testing.assert_array_equal(unpickled.read_sample(i), sample)
@@ -139,7 +139,11 @@ class UncompressedChunk(BaseChunk):
                         self.htype,
                     )
             samples = samples.astype(chunk_dtype)
-        self._data_bytes += samples.tobytes()  # type: ignore
+        if samples.flags.c_contiguous:
+            # append straight from the array's buffer, skipping the intermediate copy made by `tobytes`
+            self._data_bytes += memoryview(samples.reshape(-1).view(np.uint8))  # type: ignore
+        else:
+            self._data_bytes += samples.tobytes()  # type: ignore
         self.register_in_meta_and_headers(
             samples[0].nbytes,
             shape,
@@ -156,6 +160,19 @@ class UncompressedChunk(BaseChunk):
     ) -> float:
         num_samples: float = 0
         skipped: List[int] = []
+        # [sample_nbytes, shape, count] for runs of consecutive samples with the same size and shape,
+        # registered to the headers and meta once per run instead of once per sample.
+        pending: List[list] = []
+
+        def register_pending():
+            for sample_nbytes, shape, count in pending:
+                self.register_in_meta_and_headers(
+                    sample_nbytes,
+                    shape,
+                    update_tensor_meta=update_tensor_meta,
+                    num_samples=count,
+                )
+            pending.clear()
 
         for i, incoming_sample in enumerate(incoming_samples):
             try:
@@ -167,25 +184,30 @@ class UncompressedChunk(BaseChunk):
                 if ignore_errors:
                     skipped.append(i)
                     continue
+                register_pending()
                 raise
 
+            is_empty = self.is_empty and not pending
             # NOTE re-chunking logic should not reach to this point, for Tiled ones we do not have this logic
             if isinstance(serialized_sample, SampleTiles):
                 incoming_samples[i] = serialized_sample  # type: ignore
-                if self.is_empty:
+                if is_empty:
                     self.write_tile(serialized_sample)
                     num_samples += 0.5
                 break
             else:
                 sample_nbytes = len(serialized_sample)
-                if self.is_empty or self.can_fit_sample(sample_nbytes):
+                if is_empty or self.can_fit_sample(sample_nbytes):
                     self._data_bytes += serialized_sample  # type: ignore
 
-                    self.register_in_meta_and_headers(
-                        sample_nbytes,
-                        shape,
-                        update_tensor_meta=update_tensor_meta,
-                    )
+                    if (
+                        pending
+                        and pending[-1][0] == sample_nbytes
+                        and pending[-1][1] == shape
+                    ):
+                        pending[-1][2] += 1
+                    else:
+                        pending.append([sample_nbytes, shape, 1])
                     if isinstance(incoming_sample, LinkedTiledSample):
                         num_samples += 0.5
                         break
@@ -193,6 +215,7 @@ class UncompressedChunk(BaseChunk):
                     num_samples += 1
                 else:
                     break
+        register_pending()
 
         for i in reversed(skipped):
             incoming_samples.pop(i)
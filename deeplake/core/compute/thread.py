@@ -1,21 +1,19 @@
-from multiprocessing import Manager
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 from deeplake.core.compute.provider import ComputeProvider
-from pathos.pools import ThreadPool  # type: ignore
 
 
 class ThreadProvider(ComputeProvider):
     def __init__(self, workers):
         self.workers = workers
-        self.manager = Manager()
-        self.pool = ThreadPool(nodes=workers)
+        self.pool = ThreadPoolExecutor(max_workers=workers)
 
     def map(self, func, iterable):
-        return self.pool.map(func, iterable)
+        return list(self.pool.map(func, iterable))
 
     def create_queue(self):
-        return self.manager.Queue()
+        # Worker threads share memory, so a plain queue is enough.
+        return Queue()
 
     def close(self):
-        self.pool.close()
-        self.pool.join()
-        self.pool.clear()
+        self.pool.shutdown(wait=True)
@@ -1,6 +1,5 @@
 import posixpath
 from typing import Any, Dict, Set, Optional, Union
-from deeplake.client.utils import get_user_name
 from deeplake.constants import HUB_CLOUD_DEV_USERNAME
 from deeplake.core.dataset import Dataset
 from deeplake.client.client import DeepLakeBackendClient
@@ -100,12 +99,11 @@ class DeepLakeCloudDataset(Dataset):
         deeplake_meta: Dict[str, Any],
         has_head_changes: Optional[bool] = None,
     ):
-        username = get_user_name()
         has_head_changes = (
             has_head_changes if has_head_changes is not None else self.has_head_changes
         )
+        # username is filled in by the event sender thread.
         common_meta = {
-            "username": username,
             "commit_id": self.commit_id,
             "pending_commit_id": self.pending_commit_id,
             "has_head_changes": has_head_changes,
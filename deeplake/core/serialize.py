@@ -75,7 +75,7 @@ def serialize_chunk(
     version: str,
     shape_info: np.ndarray,
     byte_positions: np.ndarray,
-    data: Union[Sequence[bytes], Sequence[memoryview]],
+    data: Union[bytes, bytearray, memoryview, Sequence[bytes], Sequence[memoryview]],
     len_data: Optional[int] = None,
 ) -> memoryview:
     """Serializes a chunk's headers and data into a single byte stream. This is how the chunk will be written to the storage provider.
@@ -84,12 +84,14 @@ def serialize_chunk(
         version: (str) Version of deeplake library.
         shape_info: (numpy.ndarray) Encoded shapes info from the chunk's `ShapeEncoder` instance.
         byte_positions: (numpy.ndarray) Encoded byte positions from the chunk's `BytePositionsEncoder` instance.
-        data: (list) `_data` field of the chunk.
+        data: (bytes, bytearray, memoryview or list) Data bytes of the chunk, either as a single buffer or as a list of buffers.
         len_data: (int, optional) Number of bytes in the chunk.
 
     Returns:
         Serialized chunk as memoryview.
     """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = (data,)
     nbytes = infer_chunk_num_bytes(version, shape_info, byte_positions, data, len_data)
     flatbuff = bytearray(nbytes)
     offset = write_version(version, flatbuff)
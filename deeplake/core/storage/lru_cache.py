@@ -1,5 +1,6 @@
 import sys
 from collections import OrderedDict
+from deeplake.constants import CACHE_PROTECTED_RATIO
 from deeplake.core.partial_reader import PartialReader
 from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
 from deeplake.core.chunk.base_chunk import BaseChunk
@@ -8,7 +9,7 @@ from typing import Any, Dict, Optional, Union
 from deeplake.core.storage.provider import StorageProvider
 
 
-def _get_nbytes(obj: Union[bytes, memoryview, DeepLakeMemoryObject]):
+def _get_nbytes(obj: Union[bytes, bytearray, memoryview, DeepLakeMemoryObject]):
     if isinstance(obj, DeepLakeMemoryObject):
         return obj.nbytes
     return len(obj)
@@ -51,6 +52,16 @@ class LRUCache(StorageProvider):
         # tracks keys in lru order, stores size of value, only keys present in this exist in cache
         self.lru_sizes: OrderedDict[str, int] = OrderedDict()
 
+        # keys in cache that have been used only once since they were inserted (or were demoted), in insertion order.
+        # These are evicted before anything else so that a single pass over new data can't flush out the entries that are reused.
+        self._probation: Dict[str, None] = {}
+
+        # keys in cache that have been used more than once, in lru order, along with their sizes.
+        # They can take up at most `CACHE_PROTECTED_RATIO` of the cache, beyond that the least recently used ones are demoted
+        # back to probation so that new entries always have room to prove they are reused.
+        self._protected: Dict[str, int] = {}
+        self._protected_used = 0
+
         self.dirty_keys: Dict[str, None] = (
             OrderedDict() if sys.version_info < (3, 7) else {}  # type: ignore
         )  # keys present in cache but not next_storage. Using a dict instead of set to preserve order.
@@ -83,6 +94,13 @@ class LRUCache(StorageProvider):
         if path in self.lru_sizes:
             old_size = self.lru_sizes[path]
             self.cache_used -= old_size
+            if path in self._protected:
+                self._protected_used += new_size - self._protected[path]
+                self._protected[path] = new_size
+        else:
+            # the path may be left over in a segment if it was dropped from `lru_sizes` directly
+            self._discard_from_segments(path)
+            self._probation[path] = None
         self.cache_used += new_size
         self.lru_sizes[path] = new_size
 
@@ -171,7 +189,7 @@ class LRUCache(StorageProvider):
                 )
             return item
 
-        if isinstance(item, (bytes, memoryview)):
+        if isinstance(item, (bytes, bytearray, memoryview)):
             obj = (
                 expected_class.frombuffer(item)
                 if meta is None
@@ -200,10 +218,10 @@ class LRUCache(StorageProvider):
         """
         if path in self.deeplake_objects:
             if path in self.lru_sizes:
-                self.lru_sizes.move_to_end(path)  # refresh position for LRU
+                self._mark_used(path)
             return self.deeplake_objects[path]
         elif path in self.lru_sizes:
-            self.lru_sizes.move_to_end(path)  # refresh position for LRU
+            self._mark_used(path)
             return self.cache_storage[path]
         else:
             if self.next_storage is not None:
@@ -237,14 +255,14 @@ class LRUCache(StorageProvider):
         """
         if path in self.deeplake_objects:
             if path in self.lru_sizes:
-                self.lru_sizes.move_to_end(path)  # refresh position for LRU
+                self._mark_used(path)
             return self.deeplake_objects[path].tobytes()[start_byte:end_byte]
         # if it is a partially read chunk in the cache, to get new bytes, we need to look at actual storage and not the cache
         elif path in self.lru_sizes and not (
             isinstance(self.cache_storage[path], BaseChunk)
             and self.cache_storage[path].is_partially_read_chunk
         ):
-            self.lru_sizes.move_to_end(path)  # refresh position for LRU
+            self._mark_used(path)
             return self.cache_storage[path][start_byte:end_byte]
         else:
             if self.next_storage is not None:
@@ -265,13 +283,17 @@ class LRUCache(StorageProvider):
         if path in self.deeplake_objects:
             self.deeplake_objects[path].is_dirty = False
 
-        if path in self.lru_sizes:
+        cached = path in self.lru_sizes
+        if cached:
             size = self.lru_sizes.pop(path)
+            self._discard_from_segments(path)
             self.cache_used -= size
 
         if _get_nbytes(value) <= self.cache_size:
             self._insert_in_cache(path, value)
             self.dirty_keys[path] = None
+            if cached:  # overwriting a cached entry counts as reusing it
+                self._mark_used(path)
         else:  # larger than cache, directly send to next layer
             self._forward_value(path, value)
 
@@ -296,6 +318,7 @@ class LRUCache(StorageProvider):
 
         if path in self.lru_sizes:
             size = self.lru_sizes.pop(path)
+            self._discard_from_segments(path)
             self.cache_used -= size
             del self.cache_storage[path]
             self.dirty_keys.pop(path, None)
@@ -320,6 +343,9 @@ class LRUCache(StorageProvider):
     def clear_cache_without_flush(self):
         self.cache_used = 0
         self.lru_sizes.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._protected_used = 0
         self.dirty_keys.clear()
         self.cache_storage.clear()
         self.deeplake_objects.clear()
@@ -339,11 +365,15 @@ class LRUCache(StorageProvider):
             rm = [path for path in self.lru_sizes if path.startswith(prefix)]
             for path in rm:
                 size = self.lru_sizes.pop(path)
+                self._discard_from_segments(path)
                 self.cache_used -= size
                 self.dirty_keys.pop(path, None)
         else:
             self.cache_used = 0
             self.lru_sizes.clear()
+            self._probation.clear()
+            self._protected.clear()
+            self._protected_used = 0
             self.dirty_keys.clear()
             self.deeplake_objects.clear()
 
@@ -397,9 +427,46 @@ class LRUCache(StorageProvider):
         while self.cache_used > 0 and extra_size + self.cache_used > self.cache_size:
             self._pop_from_cache()
 
+    def _mark_used(self, path: str):
+        """Refreshes the LRU position of a cached path and promotes it out of probation."""
+        self.lru_sizes.move_to_end(path)
+        size = self._protected.pop(path, None)
+        if size is None:
+            self._probation.pop(path, None)
+            size = self.lru_sizes[path]
+            self._protected_used += size
+        self._protected[path] = size
+        self._demote_protected()
+
+    def _demote_protected(self):
+        """Moves the least recently used protected keys back to probation while they take up more than their share of the cache."""
+        max_protected = self.cache_size * CACHE_PROTECTED_RATIO
+        while self._protected_used > max_protected:
+            key = next(iter(self._protected))
+            self._protected_used -= self._protected.pop(key)
+            if key in self.lru_sizes:
+                self._probation[key] = None
+
+    def _discard_from_segments(self, path: str):
+        self._probation.pop(path, None)
+        size = self._protected.pop(path, None)
+        if size is not None:
+            self._protected_used -= size
+
     def _pop_from_cache(self):
-        """Helper function that pops the least recently used key, value pair from the cache"""
-        key, itemsize = self.lru_sizes.popitem(last=False)
+        """Helper function that pops a key, value pair from the cache.
+        The oldest key in probation is evicted first, falling back to the least recently used key.
+        """
+        while self._probation:
+            key = next(iter(self._probation))
+            del self._probation[key]
+            if key in self.lru_sizes:
+                break
+            # key was dropped from `lru_sizes` directly, skip it
+        else:
+            key = next(iter(self.lru_sizes))
+            self._discard_from_segments(key)
+        itemsize = self.lru_sizes.pop(key)
         if key in self.dirty_keys:
             self._forward(key)
         del self.cache_storage[key]
@@ -472,6 +539,9 @@ class LRUCache(StorageProvider):
         self.cache_size = state["cache_size"]
         self.use_async = state["use_async"]
         self.lru_sizes = OrderedDict()
+        self._probation = {}
+        self._protected = {}
+        self._protected_used = 0
         self.dirty_keys = OrderedDict()
         self.cache_used = 0
         self.deeplake_objects = {}
@@ -55,6 +55,49 @@ except Exception:
     asyncio = None  # type: ignore
 
 
+def _read_body(resp) -> bytearray:
+    """Reads the body of a ``get_object`` response directly into a preallocated buffer."""
+    body = resp["Body"]
+    size = resp.get("ContentLength")
+    if size is None or not hasattr(body, "readinto"):
+        return bytearray(body.read())
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    offset = 0
+    while offset < size:
+        n = body.readinto(view[offset:])
+        if not n:
+            break
+        offset += n
+    if offset < size:
+        raise IncompleteReadError(actual_bytes=offset, expected_bytes=size)
+    return buffer
+
+
+def _as_body(content):
+    """Returns a ``put_object`` compatible body for ``content``, copying only if unavoidable.
+
+    botocore accepts bytes and bytearray but rejects memoryview, so views spanning an entire
+    bytes-like object are unwrapped and any other view is copied once.
+    """
+    if not isinstance(content, memoryview):
+        return content
+    obj = content.obj
+    if (
+        isinstance(obj, (bytes, bytearray))
+        and content.c_contiguous
+        and content.nbytes == len(obj)
+    ):
+        return obj
+    return content.tobytes()
+
+
+def _split_bucket_and_path(root: str) -> Tuple[str, str]:
+    """Splits ``s3://bucket/path`` (or ``bucket/path``) into the bucket and the key path."""
+    bucket, _, path = root.replace("s3://", "").partition("/")
+    return bucket, path
+
+
 class S3ResetReloadCredentialsManager:
     """Tries to reload the credentials if the error is due to expired token, if error still occurs, it raises it."""
 
@@ -172,7 +215,7 @@ class S3Provider(StorageProvider):
         self.check_readonly()
         self._check_update_creds()
         path = "".join((self.path, path))
-        content = bytearray(memoryview(content))
+        content = _as_body(content)
         try:
             self._set(path, content)
         except botocore.exceptions.ClientError as err:
@@ -200,7 +243,7 @@ class S3Provider(StorageProvider):
             Bucket=bucket,
             Key=path,
         )
-        return resp["Body"].read()
+        return _read_body(resp)
 
     def __getitem__(self, path):
         """Gets the object present at the path.
@@ -209,7 +252,7 @@ class S3Provider(StorageProvider):
             path (str): the path relative to the root of the S3Provider.
 
         Returns:
-            bytes: The bytes of the object present at the path.
+            bytearray: The bytes of the object present at the path.
 
         Raises:
             KeyError: If an object is not found at the path.
@@ -231,7 +274,7 @@ class S3Provider(StorageProvider):
         else:
             range = ""
         resp = self.client.get_object(Bucket=self.bucket, Key=path, Range=range)
-        return resp["Body"].read()
+        return _read_body(resp)
 
     def get_bytes(
         self,
@@ -247,7 +290,7 @@ class S3Provider(StorageProvider):
             end_byte (int, optional): If only specific bytes up to end_byte are required.
 
         Returns:
-            bytes: The bytes of the object present at the path within the given byte range.
+            bytearray: The bytes of the object present at the path within the given byte range.
 
         Raises:
             InvalidBytesRequestedError: If ``start_byte`` > ``end_byte`` or ``start_byte`` < 0 or ``end_byte`` < 0.
@@ -330,16 +373,24 @@ class S3Provider(StorageProvider):
     def num_tries(self):
         return min(ceil((time.time() - self.start_time) / 300), 5)
 
-    def _keys_iterator(self):
-        self._check_update_creds()
+    def _list_prefix(self) -> str:
+        """Returns the prefix under which the objects of the S3Provider are listed."""
         prefix = self.path
+        return prefix[1:] if prefix.startswith("/") else prefix
+
+    def _pages_iterator(self):
+        """Lazily yields the ``list_objects_v2`` response pages under the root of the S3Provider."""
+        self._check_update_creds()
+        prefix = self._list_prefix()
         start_after = ""
-        prefix = prefix[1:] if prefix.startswith("/") else prefix
         start_after = (start_after or prefix) if prefix.endswith("/") else start_after
         paginator = self.client.get_paginator("list_objects_v2")
-        for page in paginator.paginate(
+        yield from paginator.paginate(
             Bucket=self.bucket, Prefix=prefix, StartAfter=start_after
-        ):
+        )
+
+    def _keys_iterator(self):
+        for page in self._pages_iterator():
             for content in page.get("Contents", ()):
                 yield content["Key"]
 
@@ -352,8 +403,15 @@ class S3Provider(StorageProvider):
         Raises:
             S3ListError: Any S3 error encountered while listing the objects.
         """
-        len_path = len(self.path.split("/")) - 1
-        return ("/".join(name.split("/")[len_path:]) for name in self._keys_iterator())
+        # Every listed key starts with the listing prefix. For a bucket root provider that prefix is empty
+        # while the keys it writes start with ``self.path`` ("/"), so those are stripped as well.
+        path = self.path
+        len_path = len(path)
+        len_prefix = len(self._list_prefix())
+        return (
+            name[len_path:] if name.startswith(path) else name[len_prefix:]
+            for name in self._keys_iterator()
+        )
 
     def __len__(self):
         """Returns the number of files present at the root of the S3Provider.
@@ -367,7 +425,10 @@ class S3Provider(StorageProvider):
         Raises:
             S3ListError: Any S3 error encountered while listing the objects.
         """
-        return sum(1 for _ in self._keys_iterator())
+        return sum(
+            page.get("KeyCount", len(page.get("Contents", ())))
+            for page in self._pages_iterator()
+        )
 
     def __iter__(self):
         """Generator function that iterates over the keys of the S3Provider.
@@ -407,9 +468,8 @@ class S3Provider(StorageProvider):
         paginator = self.client.get_paginator("list_objects_v2")
         pages = paginator.paginate(Bucket=self.bucket, Prefix=self.path)
         for page in pages:
-            items.extend(page["Contents"])
-        path = root.replace("s3://", "")
-        _, new_path = path.split("/", 1)
+            items.extend(page.get("Contents", ()))
+        new_path = _split_bucket_and_path(root)[1]
         try:
             dest_objects = self.client.list_objects_v2(
                 Bucket=self.bucket, Prefix=new_path
@@ -463,13 +523,7 @@ class S3Provider(StorageProvider):
         self._initialize_s3_parameters()
 
     def _set_bucket_and_path(self):
-        root = self.root.replace("s3://", "")
-        split_root = root.split("/", 1)
-        self.bucket = split_root[0]
-        if len(split_root) > 1:
-            self.path = split_root[1]
-        else:
-            self.path = ""
+        self.bucket, self.path = _split_bucket_and_path(self.root)
         if not self.path.endswith("/"):
             self.path += "/"
 
@@ -580,10 +634,7 @@ class S3Provider(StorageProvider):
     def get_presigned_url(self, key, full=False):
         self._check_update_creds()
         if full:
-            root = key.replace("s3://", "")
-            split_root = root.split("/", 1)
-            bucket = split_root[0]
-            path = split_root[1] if len(split_root) > 1 else ""
+            bucket, path = _split_bucket_and_path(key)
         else:
             bucket = self.bucket
             path = "".join((self.path, key))
@@ -617,10 +668,7 @@ class S3Provider(StorageProvider):
         return obj.content_length
 
     def get_object_from_full_url(self, url: str):
-        root = url.replace("s3://", "")
-        split_root = root.split("/", 1)
-        bucket = split_root[0]
-        path = split_root[1] if len(split_root) > 1 else ""
+        bucket, path = _split_bucket_and_path(url)
         try:
             return self._get(path, bucket)
         except botocore.exceptions.ClientError as err:
@@ -652,7 +700,7 @@ class S3Provider(StorageProvider):
                     tasks.append(
                         asyncio.ensure_future(
                             client.put_object(
-                                Bucket=self.bucket, Key=self.path + k, Body=v
+                                Bucket=self.bucket, Key=self.path + k, Body=_as_body(v)
                             )
                         )
                     )
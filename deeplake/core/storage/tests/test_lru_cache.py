@@ -44,8 +44,68 @@ def test_cache_expiring():
     assert str(lru_cache["a/one"], "utf-8") == "1"
     assert list(cache_ds.dict.keys()) == ["a/five2", "a/one"]
 
+    # a/five2 has been reused, so the single use a/one is evicted before it
     assert str(lru_cache["a/five1"], "utf-8") == "12345"
-    assert list(cache_ds.dict.keys()) == ["a/one", "a/five1"]
+    assert list(cache_ds.dict.keys()) == ["a/five2", "a/five1"]
+
+
+def test_cache_scan_resistance():
+    real_ds = MemoryProvider()
+    for i in range(10):
+        real_ds[f"a/{i}"] = bytes("12345", "utf-8")
+
+    cache_ds = MemoryProvider()
+    lru_cache = LRUCache(cache_storage=cache_ds, next_storage=real_ds, cache_size=15)
+
+    for _ in range(2):
+        lru_cache["a/0"]
+        lru_cache["a/1"]
+
+    # a single pass over data that doesn't fit only cycles through the remaining space
+    for i in range(2, 10):
+        lru_cache[f"a/{i}"]
+    assert list(cache_ds.dict.keys()) == ["a/0", "a/1", "a/9"]
+
+    # once nothing was used only once, eviction falls back to LRU order
+    lru_cache["a/9"]
+    lru_cache["a/0"]
+    lru_cache["a/2"]
+    assert list(cache_ds.dict.keys()) == ["a/0", "a/9", "a/2"]
+
+
+class CountingMemoryProvider(MemoryProvider):
+    def __init__(self, root=""):
+        super().__init__(root)
+        self.reads = 0
+
+    def __getitem__(self, path):
+        self.reads += 1
+        return super().__getitem__(path)
+
+
+def test_cache_interleaved_reads():
+    real_ds = CountingMemoryProvider()
+    for i in range(10):
+        real_ds[f"a/{i}"] = bytes("12345", "utf-8")
+    real_ds["a/img"] = bytes("12345", "utf-8")
+    real_ds["a/lbl"] = bytes("12345", "utf-8")
+
+    cache_ds = MemoryProvider()
+    lru_cache = LRUCache(cache_storage=cache_ds, next_storage=real_ds, cache_size=50)
+
+    # every slot is taken by an entry that was reused
+    for _ in range(2):
+        for i in range(10):
+            lru_cache[f"a/{i}"]
+    assert real_ds.reads == 10
+
+    # new entries that are reused over and over still get promoted instead of replacing each other in probation
+    for _ in range(1000):
+        lru_cache["a/img"]
+        lru_cache["a/lbl"]
+    assert real_ds.reads == 12
+    assert "a/img" in cache_ds.dict and "a/lbl" in cache_ds.dict
+    assert lru_cache._protected_used <= 0.75 * lru_cache.cache_size
 
 
 def test_cache_zero_size():
@@ -0,0 +1,89 @@
+import io
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from botocore.exceptions import IncompleteReadError
+
+from deeplake.core.storage.s3 import S3Provider, _as_body, _read_body
+
+
+def mock_s3_provider(path, keys=()):
+    """Returns an S3Provider rooted at ``path`` with a mocked client, listing ``keys``."""
+    provider = S3Provider.__new__(S3Provider)
+    provider.bucket = "bucket"
+    provider.path = path
+    provider._check_update_creds = lambda *args, **kwargs: None
+    provider.client = MagicMock()
+    paginate = provider.client.get_paginator.return_value.paginate
+    paginate.return_value = [{"Contents": [{"Key": key} for key in keys]}]
+    return provider
+
+
+class NoReadIntoBody:
+    def __init__(self, data):
+        self.data = data
+
+    def read(self):
+        return self.data
+
+
+class ShortReadBody(io.BytesIO):
+    def readinto(self, buffer):
+        return super().readinto(memoryview(buffer)[:100])
+
+
+def test_read_body():
+    data = bytes(range(256)) * 40
+
+    out = _read_body({"Body": io.BytesIO(data), "ContentLength": len(data)})
+    assert isinstance(out, bytearray)
+    assert out == data
+
+    # readinto may return less than requested, the rest is read in following calls
+    body = ShortReadBody(data)
+    assert _read_body({"Body": body, "ContentLength": len(data)}) == data
+
+    assert _read_body({"Body": io.BytesIO(b""), "ContentLength": 0}) == b""
+    assert _read_body({"Body": io.BytesIO(data)}) == data
+    assert _read_body({"Body": NoReadIntoBody(data), "ContentLength": 3}) == data
+
+    with pytest.raises(IncompleteReadError):
+        _read_body({"Body": io.BytesIO(data[:-1]), "ContentLength": len(data)})
+
+
+def test_as_body():
+    data = b"abcdefgh"
+    assert _as_body(data) is data
+
+    buffer = bytearray(data)
+    assert _as_body(buffer) is buffer
+
+    # a view spanning the whole object is unwrapped without copying
+    assert _as_body(memoryview(data)) is data
+    assert _as_body(memoryview(buffer)) is buffer
+
+    sliced = _as_body(memoryview(data)[2:5])
+    assert isinstance(sliced, bytes)
+    assert sliced == b"cde"
+
+    arr = np.arange(4, dtype=np.int32)
+    out = _as_body(memoryview(arr))
+    assert isinstance(out, bytes)
+    assert out == arr.tobytes()
+
+    out = _as_body(memoryview(data).cast("I"))
+    assert out is data
+
+
+def test_all_keys():
+    provider = mock_s3_provider("dir/ds/", ["dir/ds/a", "dir/ds/b/c"])
+    assert sorted(provider._all_keys()) == ["a", "b/c"]
+    paginate = provider.client.get_paginator.return_value.paginate
+    assert paginate.call_args.kwargs["Prefix"] == "dir/ds/"
+
+    # bucket root, keys written through the provider start with "/" but others don't
+    provider = mock_s3_provider("/", ["/a", "/b/c", "data/d"])
+    assert sorted(provider._all_keys()) == ["a", "b/c", "data/d"]
+    paginate = provider.client.get_paginator.return_value.paginate
+    assert paginate.call_args.kwargs["Prefix"] == ""
@@ -38,6 +38,20 @@ def test_chunk_serialize():
     assert b"".join(data) == bytes(data2)
 
 
+def test_chunk_serialize_single_buffer():
+    version = deeplake.__version__
+    shape_info = np.cast[ENCODING_DTYPE](np.random.randint(100, size=(17, 63)))
+    byte_positions = np.cast[ENCODING_DTYPE](np.random.randint(100, size=(31, 3)))
+    data = bytearray(b"x" * 1024)
+    encoded = serialize_chunk(version, shape_info, byte_positions, data)
+    assert encoded == serialize_chunk(version, shape_info, byte_positions, [data])
+
+    encoded = serialize_chunk(
+        version, shape_info, byte_positions, memoryview(data)[:10]
+    )
+    assert bytes(deserialize_chunk(encoded)[3]) == b"x" * 10
+
+
 def test_chunkids_serialize():
     version = deeplake.__version__
     arr = np.cast[ENCODING_DTYPE](np.random.randint(100, size=(100, 2)))
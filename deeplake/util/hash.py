@@ -9,5 +9,5 @@ def hash_inputs(*args) -> str:
 
 
 def hash_str_to_int32(string: str):
-    hash_ = int(hashlib.sha256(string.encode("utf-8")).hexdigest(), 16) >> 224
-    return hash_
+    # Top 32 bits of the digest, read directly instead of via the hex string.
+    return int.from_bytes(hashlib.sha256(string.encode("utf-8")).digest()[:4], "big")